@@ -0,0 +1,30 @@
+"""Legend CLI commands.
+
+Command modules are imported lazily on attribute access (PEP 562), so running
+one command doesn't pay for the imports of all the others.
+"""
+
+import importlib
+
+# Command name -> (module, class name, aliases)
+COMMANDS = {
+    'new': ('new', 'NewCommand', ['n']),
+    'generate': ('generate', 'GenerateCommand', ['g']),
+    'run': ('run', 'RunCommand', ['r']),
+    'test': ('test', 'TestCommand', ['t']),
+    'console': ('console', 'ConsoleCommand', ['c']),
+    'provision': ('provision', 'ProvisionCommand', ['p']),
+    'deploy': ('deploy', 'DeployCommand', []),
+    'bootstrap': ('bootstrap', 'BootstrapCommand', []),
+    'info': ('info', 'InfoCommand', ['i']),
+    'destroy': ('destroy', 'DestroyCommand', []),
+}
+ALIASES = {alias: name for name, (_, _, aliases) in COMMANDS.items() for alias in aliases}
+
+__all__ = [module for module, _, _ in COMMANDS.values()]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
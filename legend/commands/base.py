@@ -3,16 +3,111 @@ Base command class providing common functionality for Legend CLI commands.
 """
 
 import argparse
+import contextlib
+import shlex
+import shutil
 import subprocess
 import sys
 import os
-from typing import List, Dict, Any, Optional, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, Union
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from . import COMMANDS
 from ..lib.config import Configuration, ConfigurationError
 
 from abc import ABC, abstractmethod
 
+# orjson parses the (sometimes large) JSON returned by az several times
+# faster than the standard library; it's an optional extra
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+# Where compiled template bytecode is kept between runs
+JINJA_CACHE_DIR = Path.home() / ".legend" / "jinja_cache"
+
+# Azure CLI settings (the env var form of `az config set ...`) that skip work
+# we never need: telemetry upload, upgrade checks, warnings and progress bars
+# on stderr, and prompting to install missing extensions (which would hang
+# with captured output). Values already set in the user's environment win.
+_AZ_PERF_ENV = {
+    "AZURE_CORE_COLLECT_TELEMETRY": "false",
+    "AZURE_AUTO-UPGRADE_ENABLE": "no",
+    "AZURE_CORE_ONLY_SHOW_ERRORS": "true",
+    "AZURE_CORE_DISABLE_PROGRESS_BAR": "true",
+    "AZURE_EXTENSION_USE_DYNAMIC_INSTALL": "no",
+}
+
+# The in-process Azure CLI writes to shared logging/output state, so only one
+# command may run through it at a time
+_AZ_CLI_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_default_cli():
+    """Get azure.cli.core.get_default_cli if the azure-cli package is importable.
+
+    Running az commands in-process avoids paying the CLI's interpreter startup
+    and module discovery on every call. Returns None when azure-cli isn't
+    installed alongside legend, in which case az is run as a subprocess.
+    """
+    try:
+        from azure.cli.core import get_default_cli
+    except ImportError:
+        return None
+    for key, value in _AZ_PERF_ENV.items():
+        os.environ.setdefault(key, value)
+    return get_default_cli
+
+
+@lru_cache(maxsize=32)
+def _resolve_executable(name: str) -> str:
+    """Full path of a command found on PATH, or the name unchanged if it isn't found.
+
+    subprocess can only launch with posix_spawn (much cheaper than fork()
+    for a large parent process) when given a path rather than a bare name.
+    """
+    if os.sep in name:
+        return name
+    return shutil.which(name) or name
+
+
+@lru_cache(maxsize=4)
+def _get_env(templates_dir: str):
+    """Get a shared Jinja environment for a templates directory.
+
+    The environment keeps compiled templates in its cache, so rendering the
+    same template again skips loading and compiling it. Templates ship with
+    the package and never change at runtime, so auto_reload is disabled to
+    avoid a stat() per render. Compiled bytecode is also kept on disk under
+    JINJA_CACHE_DIR so later invocations of the CLI skip compiling too.
+    """
+    # jinja2 is only needed by the scaffolding commands, so don't make
+    # every CLI invocation pay for importing it
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    bytecode_cache = None
+    try:
+        JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+    except OSError:
+        # e.g. a read-only home directory; just compile templates every time
+        pass
+
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        # Never evict: the whole templates tree easily fits in memory
+        cache_size=-1
+    )
+
+
 class Command(ABC):
     """Base class for Legend CLI commands providing common functionality."""
     
@@ -22,15 +117,26 @@ class Command(ABC):
         Args:
             name: Name of the command (e.g. 'info')
             description: Description of what the command does
-            aliases: Optional list of command aliases (e.g. ['i'])
+            aliases: Optional list of command aliases (e.g. ['i']). Built-in
+                commands take theirs from the COMMANDS registry instead.
         """
         self.name = name
         self.description = description
-        self.aliases = aliases or []
-        self.parser = self.setup_parser()
+        if aliases is None:
+            registered = COMMANDS.get(name)
+            aliases = registered[2] if registered else []
+        self.aliases = list(aliases)
+        self._parser: Optional[argparse.ArgumentParser] = None
         self.verbose = False
         self._config: Optional[Configuration] = None
 
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Get the command's argument parser, building it on first use."""
+        if self._parser is None:
+            self._parser = self.setup_parser()
+        return self._parser
+
     def setup_parser(self) -> argparse.ArgumentParser:
         """Setup command-specific argument parser.
         
@@ -84,45 +190,37 @@ class Command(ABC):
         return self.handle(args)
     
 
-    def format_output(self, message: str, status: str = "info") -> str:
-        """Format output with appropriate emoji and styling.
-        
-        Args:
-            message: The message to format
-            status: One of "info", "success", "error", "warning"
-            
-        Returns:
-            Formatted message string
-        """
-        status_indicators = {
-            "info": "",
-            "success": "✅ ",
-            "error": "⛔️ ",
-            "warning": "🟡 ",
-            "completed": "✨ "
-        }
-        indicator = status_indicators.get(status, "")
-        return f"{indicator}{message}"
+    # Status indicators prefixed to output messages
+    _P_INFO = ""
+    _P_SUCCESS = "✅ "
+    _P_ERROR = "⛔️ "
+    _P_WARNING = "🟡 "
+    _P_COMPLETED = "✨ "
+
+    # The status helpers below emit each message with a single write() rather
+    # than print(), which writes the message and the newline separately.
+    # They stay on the text layer (not sys.stdout.buffer) so output keeps its
+    # order relative to plain print() calls and works when stdout is replaced.
 
     def info(self, message: str):
         """Print an info message."""
-        print(self.format_output(message, "info"))
+        sys.stdout.write(f"{self._P_INFO}{message}\n")
 
     def success(self, message: str):
         """Print a success message."""
-        print(self.format_output(message, "success"))
+        sys.stdout.write(f"{self._P_SUCCESS}{message}\n")
 
     def warning(self, message: str):
         """Print a warning message."""
-        print(self.format_output(message, "warning"))
+        sys.stdout.write(f"{self._P_WARNING}{message}\n")
 
     def error(self, message: str):
         """Print an error message."""
-        print(self.format_output(message, "error"))
+        sys.stdout.write(f"{self._P_ERROR}{message}\n")
 
     def completed(self, message: str):
         """Print a completion message."""
-        print(self.format_output(message, "completed"))
+        sys.stdout.write(f"{self._P_COMPLETED}{message}\n")
 
     def handle_error(self, error: Exception, context: str = "") -> None:
         """Standardized error handling.
@@ -158,11 +256,11 @@ class Command(ABC):
         """
         try:
             if self.verbose:
-                self.info(f"Running command: {' '.join(cmd)}")
+                self.info("Running command: " + shlex.join(cmd))
             
-            process_env = os.environ.copy()
-            if env:
-                process_env.update(env)
+            # Without overrides the child simply inherits our environment,
+            # so only build a merged copy when there is something to add
+            process_env = {**os.environ, **env} if env else None
             
             # Set some defaults that can be overridden by kwargs
             subprocess_args = {
@@ -172,6 +270,14 @@ class Command(ABC):
                 'stdout': None,
                 'stderr': None,
             }
+            if os.name == "posix":
+                # subprocess only uses posix_spawn instead of fork()+exec()
+                # when given an executable path, with no preexec_fn, cwd or
+                # new session, and (before Python 3.13) with close_fds off.
+                # Leaving fds open is safe: Python creates its own fds,
+                # including the pipes for the child, non-inheritable.
+                cmd = [_resolve_executable(cmd[0]), *cmd[1:]]
+                subprocess_args['close_fds'] = False
             subprocess_args.update(kwargs)
             
             return subprocess.run(
@@ -183,7 +289,7 @@ class Command(ABC):
             if check:
                 raise e
             if self.verbose:
-                self.handle_error(e, f"Command failed: {' '.join(cmd)}")
+                self.handle_error(e, "Command failed: " + shlex.join(cmd))
             return None
 
     def run_azure_command(self, 
@@ -193,22 +299,77 @@ class Command(ABC):
         """Execute Azure CLI commands.
         
         Args:
-            cmd: Azure CLI command and arguments (without 'az' prefix)
+            cmd: Azure CLI command and arguments, starting with 'az'
             output_format: Desired output format (json, tsv, etc.)
             
         Returns:
             Command output parsed according to output_format, or None if command fails
         """
+        # The in-process path only understands `check`; anything else (e.g.
+        # streaming output) needs a real subprocess
+        get_default_cli = _get_default_cli() if cmd[:1] == ["az"] and set(kwargs) <= {"check"} else None
+        if get_default_cli:
+            return self._invoke_azure_cli(get_default_cli, cmd[1:], output_format, kwargs.get("check", True))
+
         full_cmd = cmd + ["-o", output_format]
-        result = self.run_subprocess(full_cmd, **kwargs)
-        if not result:
+        env = {key: value for key, value in _AZ_PERF_ENV.items() if key not in os.environ}
+        env.update(kwargs.pop("env", None) or {})
+
+        # JSON is parsed straight from the raw bytes, skipping a decode to str
+        raw = output_format == "json" and "text" not in kwargs and "input" not in kwargs
+        if raw:
+            kwargs["text"] = False
+        try:
+            result = self.run_subprocess(full_cmd, env=env, **kwargs)
+        except subprocess.CalledProcessError as e:
+            # Callers inspect the error output as text
+            if raw:
+                e.stdout = e.stdout.decode(errors="replace") if e.stdout else e.stdout
+                e.stderr = e.stderr.decode(errors="replace") if e.stderr else e.stderr
+            raise
+        # With check=False a failed command still returns a CompletedProcess
+        if not result or result.returncode != 0:
             return None
             
+        if raw:
+            return _json_loads(result.stdout) if result.stdout.strip() else ""
         if output_format == "json" and result.stdout.strip():
-            import json
-            return json.loads(result.stdout)
+            return _json_loads(result.stdout)
         return result.stdout.strip()
 
+    def _invoke_azure_cli(self, get_default_cli, args: List[str], output_format: str, check: bool):
+        """Run an Azure CLI command inside this process.
+        
+        Args:
+            get_default_cli: azure.cli.core.get_default_cli
+            args: Azure CLI arguments without the 'az' prefix
+            output_format: Desired output format (json, tsv, etc.)
+            check: Whether to raise an exception on non-zero exit
+            
+        Returns:
+            Command output parsed according to output_format, or None if command fails
+        """
+        import io
+        if self.verbose:
+            self.info("Running command in-process: " + shlex.join(["az"] + args))
+
+        out = io.StringIO()
+        # The CLI reports errors on stderr; capture them so callers can inspect
+        # e.stderr just as they would for a subprocess
+        err = io.StringIO()
+        with _AZ_CLI_LOCK, contextlib.redirect_stderr(err):
+            exit_code = get_default_cli().invoke(args + ["-o", output_format], out_file=out)
+
+        if exit_code:
+            if check:
+                raise subprocess.CalledProcessError(exit_code, ["az"] + args,
+                                                    output=out.getvalue(), stderr=err.getvalue())
+            return None
+
+        output = out.getvalue()
+        if output_format == "json" and output.strip():
+            return _json_loads(output)
+        return output.strip()
 
     def load_config(self, environment: str) -> bool:
         """Load configuration for the specified environment
@@ -250,25 +411,81 @@ class Command(ABC):
             output_path: Path where the rendered file should be written
             context: Dictionary of variables to pass to the template
         """
-        if self.verbose:
-            self.info(f"Rendering {template_path} -> {output_path}")
+        self.render_templates([(template_path, output_path, context)])
 
-        try:
-            templates_dir = Path(__file__).parent.parent / "templates"
-            env = Environment(loader=FileSystemLoader(templates_dir))
-            template = env.get_template(template_path)
+    def confirm_overwrite(self, output_path: str) -> bool:
+        """Ask before overwriting an existing file.
+        
+        Args:
+            output_path: Path of the file about to be written
             
-            output_file = Path(output_path)
-            if output_file.exists():
-                response = input(f"File {output_path} already exists. Overwrite? [Y/n] ")
-                if response.lower() == 'n':
-                    self.info(f"Skipping {output_path}")
-                    return
-                
+        Returns:
+            bool: True if the file doesn't exist yet or may be overwritten
+        """
+        if Path(output_path).exists():
+            response = input(f"File {output_path} already exists. Overwrite? [Y/n] ")
+            if response.lower() == 'n':
+                self.info(f"Skipping {output_path}")
+                return False
+        return True
+
+    def render_templates(self, specs: List[Tuple[str, str, dict]]):
+        """Render several template files at once.
+
+        Overwrite prompts are asked up front, one at a time; the renders and
+        file writes for everything confirmed then run on a small thread pool.
+        
+        Args:
+            specs: List of (template_path, output_path, context) tuples, as
+                would be passed to render_template
+        """
+        jobs = []
+        # Several outputs often share a template (e.g. one per environment),
+        # so each template is only looked up once
+        loaded = {}
+        for template_path, output_path, context in specs:
+            if self.verbose:
+                self.info(f"Rendering {template_path} -> {output_path}")
+
+            template = loaded.get(template_path)
+            if template is None:
+                try:
+                    template = loaded[template_path] = self.load_template(template_path)
+                except Exception as e:
+                    self.error(f"Failed to render template {template_path}: {e}")
+                    raise
+
+            if not self.confirm_overwrite(output_path):
+                continue
+
+            jobs.append((template, output_path, context))
+
+        if not jobs:
+            return
+        if len(jobs) == 1:
+            self._write_template(*jobs[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            list(executor.map(lambda job: self._write_template(*job), jobs))
+
+    def load_template(self, template_path: str):
+        """Load and compile a template without rendering it.
+
+        Templates are cached once loaded, so this can be used to warm up a
+        template ahead of a later render_template call.
+        
+        Args:
+            template_path: Path to the template file relative to templates dir
+        """
+        return _get_env(str(TEMPLATES_DIR)).get_template(template_path)
+
+    def _write_template(self, template, output_path: str, context: dict):
+        """Render a loaded template and write it to output_path."""
+        try:
             with open(output_path, "w") as f:
                 f.write(template.render(**context))
         except Exception as e:
-            self.error(f"Failed to render template {template_path}: {e}")
+            self.error(f"Failed to render template {template.name}: {e}")
             raise
 
     def is_legend_project(self) -> bool:
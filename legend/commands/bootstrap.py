@@ -1,72 +1,94 @@
+import json
 import subprocess
 import sys
 import platform
-from typing import List, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 from .base import Command
 
+# Successful version probes are remembered here so repeat runs don't have to
+# spawn every tool again. Failures are never cached, so a freshly installed
+# tool is picked up on the next run.
+CHECK_CACHE_FILE = Path.home() / ".legend" / "bootstrap_cache.json"
+CHECK_CACHE_TTL = 24 * 60 * 60  # seconds
+
+_IS_DARWIN = platform.system() == "Darwin"
+
 class Dependency:
-    def __init__(self, name: str, check_cmd: str, install_cmd: Optional[str] = None, 
+    def __init__(self, name: str, check_argv: Tuple[str, ...], install_cmd: Optional[str] = None, 
                  check_output: Optional[str] = None, homepage: Optional[str] = None):
         self.name = name
-        self.check_cmd = check_cmd
+        self.check_argv = check_argv
+        self.check_cmd = " ".join(check_argv)  # For display and as the cache key
         self.install_cmd = install_cmd
         self.check_output = check_output  # If set, check if output contains this string
         self.homepage = homepage
 
+
+# All dependencies and how to check/install them
+_DEPENDENCIES = (
+    Dependency(
+        name="Homebrew",
+        check_argv=("brew", "--version"),
+        homepage="https://brew.sh",
+    ),
+    Dependency(
+        name="Git",
+        check_argv=("git", "--version"),
+        homepage="https://git-scm.com",
+    ),
+    Dependency(
+        name="pip",
+        check_argv=("pip3", "--version"),
+        install_cmd="python3 -m ensurepip --upgrade",
+        homepage="https://pip.pypa.io",
+    ),
+    Dependency(
+        name="Azure Functions Core Tools",
+        check_argv=("func", "--version"),
+        install_cmd="brew install azure-functions-core-tools@4",
+        homepage="https://learn.microsoft.com/en-us/azure/azure-functions/functions-run-local",
+    ),
+    Dependency(
+        name="Azure CLI",
+        check_argv=("az", "--version"),
+        install_cmd="brew install azure-cli",
+        homepage="https://learn.microsoft.com/en-us/cli/azure/install-azure-cli",
+    ),
+    Dependency(
+        name="Github CLI",
+        check_argv=("gh", "--version"),
+        install_cmd="brew install gh",
+        homepage="https://github.com/cli/cli",
+    ),
+)
+
 class BootstrapCommand(Command):
     """Command to check and install dependencies"""
 
     def __init__(self):
         super().__init__(
             name='bootstrap',
-            description='Check and install dependencies',
-            aliases=[]
+            description='Check and install dependencies'
         )
+        self._check_cache: Dict[str, Dict] = {}
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-cache',
+                          action='store_true',
+                          help='Ignore cached results and re-check every dependency')
 
-    def get_dependencies(self) -> List[Dependency]:
+    def get_dependencies(self) -> Tuple[Dependency, ...]:
         """Define all dependencies and how to check/install them"""
-        return [
-            Dependency(
-                name="Homebrew",
-                check_cmd="brew --version",
-                homepage="https://brew.sh",
-            ),
-            Dependency(
-                name="Git",
-                check_cmd="git --version",
-                homepage="https://git-scm.com",
-            ),
-            Dependency(
-                name="pip",
-                check_cmd="pip3 --version",
-                install_cmd="python3 -m ensurepip --upgrade",
-                homepage="https://pip.pypa.io",
-            ),
-            Dependency(
-                name="Azure Functions Core Tools",
-                check_cmd="func --version",
-                install_cmd="brew install azure-functions-core-tools@4",
-                homepage="https://learn.microsoft.com/en-us/azure/azure-functions/functions-run-local",
-            ),
-            Dependency(
-                name="Azure CLI",
-                check_cmd="az --version",
-                install_cmd="brew install azure-cli",
-                homepage="https://learn.microsoft.com/en-us/cli/azure/install-azure-cli",
-            ),
-            Dependency(
-                name="Github CLI",
-                check_cmd="gh --version",
-                install_cmd="brew install gh",
-                homepage="https://github.com/cli/cli",
-            ),
-        ]
+        return _DEPENDENCIES
 
     def check_dependency(self, dep: Dependency) -> bool:
         """Check if a dependency is installed"""
         try:
             result = self.run_subprocess(
-                dep.check_cmd.split(),
+                dep.check_argv,
                 capture_output=True,
                 check=False
             )
@@ -78,16 +100,59 @@ class BootstrapCommand(Command):
         except FileNotFoundError:
             return False
 
+    def load_check_cache(self) -> Dict[str, Dict]:
+        """Load cached dependency check results, keyed by check command"""
+        import fcntl
+        try:
+            with open(CHECK_CACHE_FILE) as f:
+                fcntl.flock(f, fcntl.LOCK_SH)
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def save_check_cache(self, cache: Dict[str, Dict]):
+        """Write dependency check results back to the cache file"""
+        import fcntl
+        try:
+            CHECK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(CHECK_CACHE_FILE, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                f.seek(0)
+                f.truncate()
+                json.dump(cache, f)
+        except OSError as e:
+            if self.verbose:
+                self.warning(f"Could not write dependency cache: {e}")
+
+    def _cached_entry(self, dep: Dependency) -> Optional[Dict]:
+        """Return the cached result for a dependency if it is still fresh"""
+        entry = self._check_cache.get(dep.check_cmd)
+        if isinstance(entry, dict) and entry.get("ok") and time.time() - entry.get("ts", 0) < CHECK_CACHE_TTL:
+            return entry
+        return None
+
+    def _cached_check(self, dep: Dependency) -> bool:
+        """Check a dependency, using a recent cached success if there is one"""
+        if self._cached_entry(dep):
+            return True
+        return self.check_dependency(dep)
+
     def install_dependency(self, dep: Dependency) -> bool:
         """Install a dependency"""
         if not dep.install_cmd:
             return False
             
-        result = self.run_subprocess(
-            dep.install_cmd.split(),
-            check=True,
-            capture_output=True
-        )
+        # Let installer output stream straight to the terminal so long
+        # installs show progress instead of buffering everything in memory
+        try:
+            result = self.run_subprocess(
+                dep.install_cmd.split(),
+                check=True,
+                capture_output=False
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return False
         return result is not None
 
     def needs_legend_project(self) -> bool:
@@ -96,17 +161,31 @@ class BootstrapCommand(Command):
 
     def handle(self, args):
         """Check for missing dependencies and offer to install them"""
-        if platform.system() != "Darwin":
+        if not _IS_DARWIN:
             self.error("This command currently only supports macOS")
             sys.exit(1)
 
         self.info("Checking dependencies...")
         missing: List[Dependency] = []
         installed: List[Dependency] = []
-        
-        for dep in self.get_dependencies():
+
+        # Version probes are independent and mostly spent waiting on process
+        # startup, so run them all at once and report in declaration order
+        deps = self.get_dependencies()
+        self._check_cache = {} if args.no_cache else self.load_check_cache()
+        with ThreadPoolExecutor(max_workers=len(deps)) as executor:
+            results = list(executor.map(self._cached_check, deps))
+
+        now = time.time()
+        cache = {
+            dep.check_cmd: self._cached_entry(dep) or {"ok": True, "ts": now}
+            for dep, ok in zip(deps, results) if ok
+        }
+        self.save_check_cache(cache)
+
+        for dep, ok in zip(deps, results):
             self.info(f"\nChecking {dep.name}...")
-            if self.check_dependency(dep):
+            if ok:
                 self.success(f"{dep.name} is installed")
                 installed.append(dep)
             else:
@@ -1,8 +1,52 @@
 import os
-import importlib.util
-import azure.functions as func
+import sys
+import threading
 from .base import Command
 
+# Console banner, printed around the list of loaded functions
+_HELP_HEADER = """
+Legend Console - Your functions are loaded and ready to test!
+
+Available functions from function_app.py:"""
+
+_HELP_EXAMPLE = """
+To test a function, create a mock request and call it:
+
+Example:
+    # Create a mock HTTP request
+    req = func.HttpRequest(
+        method='GET',
+        body=None,
+        url='/api/my_function',
+        params={'name': 'Test'}
+    )
+    
+    # Or with JSON body
+    req = func.HttpRequest(
+        method='POST',
+        body=b'{"name": "Test"}',
+        url='/api/my_function',
+        params={}
+    )
+    
+    # Call the function
+    response = my_function(req)
+    
+    # Check the response
+    print(response.get_body().decode())
+    print(f"Status: {response.status_code}")
+    """
+
+
+def _warm_imports(modules):
+    """Import modules in the background so they are loaded when needed."""
+    for module in modules:
+        try:
+            __import__(module)
+        except Exception:
+            # The foreground import reports any real problem
+            pass
+
 
 class ConsoleCommand(Command):
     """Start an interactive Python console with your function app loaded"""
@@ -10,80 +54,80 @@ class ConsoleCommand(Command):
     def __init__(self):
         super().__init__(
             name='console',
-            description='Start an interactive Python console with your function app loaded',
-            aliases=['c']
+            description='Start an interactive Python console with your function app loaded'
         )
     
     def add_arguments(self, parser):
-        # No additional arguments needed
-        pass
+        parser.add_argument('--plain',
+                          action='store_true',
+                          default=os.environ.get('LEGEND_REPL') == 'plain',
+                          help='Use the standard Python REPL instead of ptpython (or set LEGEND_REPL=plain)')
     
-    def start_repl(self, namespace):
+    def start_repl(self, namespace, plain: bool = False):
         """Start the best available REPL."""
-        self.info("\nChecking available REPLs...")
-        try:
-            import sys
-            from ptpython.repl import embed
-            self.success("ptpython found, using enhanced REPL")
-            embed(globals=namespace, locals=namespace)
-        except ImportError as e:
-            self.warning(f"ptpython not found ({str(e)}), falling back to standard REPL")
-            import code
-            code.interact(local=namespace)
+        if not plain:
+            self.info("\nChecking available REPLs...")
+            import importlib.util
+            try:
+                found = importlib.util.find_spec('ptpython.repl') is not None
+            except ImportError:
+                # find_spec raises when the parent package itself is missing
+                found = False
+            if not found:
+                self.warning("ptpython not found, falling back to standard REPL")
+            else:
+                try:
+                    from ptpython.repl import embed
+                except ImportError as e:
+                    # Found but unusable, e.g. an incompatible prompt_toolkit
+                    self.warning(f"ptpython could not be loaded ({e}), falling back to standard REPL")
+                else:
+                    self.success("ptpython found, using enhanced REPL")
+                    embed(globals=namespace, locals=namespace)
+                    return
+
+        import code
+        code.interact(local=namespace)
 
     def import_function_app(self):
         """Import the function_app module."""
-        if not os.path.exists('function_app.py'):
+        import importlib.util
+
+        try:
+            os.stat('function_app.py')
+        except FileNotFoundError:
             self.error("function_app.py not found in current directory")
             return None
+
+        # Reuse the module if this process has already loaded it
+        path = os.path.abspath('function_app.py')
+        module = sys.modules.get('function_app')
+        if module is not None and getattr(module, '__file__', None) == path:
+            return module
         
         try:
-            spec = importlib.util.spec_from_file_location('function_app', 'function_app.py')
+            spec = importlib.util.spec_from_file_location('function_app', path)
             module = importlib.util.module_from_spec(spec)
+            # Register before executing, as the import system does, so that
+            # `import function_app` in the console or in tests gets this same
+            # module instead of loading a second copy
+            sys.modules['function_app'] = module
             spec.loader.exec_module(module)
             return module
         except Exception as e:
+            sys.modules.pop('function_app', None)
             self.error(f"Failed to load function_app.py: {e}")
             return None
 
-    def print_help(self, app):
+    def get_route_functions(self, app):
+        """Find all functions with the @app.route decorator."""
+        return [(name, obj) for name, obj in vars(app).items()
+                if callable(obj) and getattr(obj, '__route__', None) is not None]
+
+    def print_help(self, route_funcs):
         """Print helpful instructions for using the console."""
-        self.info("\nLegend Console - Your functions are loaded and ready to test!")
-        self.info("\nAvailable functions from function_app.py:")
-        
-        # Find all functions with the @app.route decorator
-        funcs = [name for name, obj in vars(app).items() 
-                if callable(obj) and hasattr(obj, '__route__')]
-        
-        for func_name in funcs:
-            self.info(f"  - {func_name}")
-        
-        self.info("\nTo test a function, create a mock request and call it:")
-        self.info("""
-Example:
-    # Create a mock HTTP request
-    req = func.HttpRequest(
-        method='GET',
-        body=None,
-        url='/api/my_function',
-        params={'name': 'Test'}
-    )
-    
-    # Or with JSON body
-    req = func.HttpRequest(
-        method='POST',
-        body=b'{"name": "Test"}',
-        url='/api/my_function',
-        params={}
-    )
-    
-    # Call the function
-    response = my_function(req)
-    
-    # Check the response
-    print(response.get_body().decode())
-    print(f"Status: {response.status_code}")
-    """)
+        names = [f"  - {func_name}" for func_name, _ in route_funcs]
+        self.info("\n".join([_HELP_HEADER, *names, _HELP_EXAMPLE]))
 
     def handle(self, args):
         # Use the appropriate Python executable based on OS
@@ -94,10 +138,22 @@ Example:
             self.error("Virtual environment not found. Run 'legend bootstrap' first")
             return 1
 
+        # Load the REPL and azure.functions (including the decorators module
+        # function_app.py builds on) while function_app.py executes, rather
+        # than one after the other
+        warm_modules = ['azure.functions', 'azure.functions.decorators']
+        if not args.plain:
+            warm_modules.insert(0, 'ptpython.repl')
+        threading.Thread(target=_warm_imports, args=(warm_modules,), daemon=True).start()
+
         app = self.import_function_app()
         if not app:
             return
 
+        # azure.functions pulls in a large dependency tree, so only import it
+        # once we're actually starting the console
+        import azure.functions as func
+
         # Create namespace with azure.functions and the app module
         namespace = {
             'func': func,
@@ -105,10 +161,8 @@ Example:
         }
         
         # Add all functions to the namespace
-        namespace.update({
-            name: obj for name, obj in vars(app).items() 
-            if callable(obj) and hasattr(obj, '__route__')
-        })
+        route_funcs = self.get_route_functions(app)
+        namespace.update(route_funcs)
         
-        self.print_help(app)
-        self.start_repl(namespace)
+        self.print_help(route_funcs)
+        self.start_repl(namespace, plain=args.plain)
@@ -1,12 +1,13 @@
 import re
-from pathlib import Path
-from subprocess import STDOUT
+from concurrent.futures import ThreadPoolExecutor
 from .base import Command
 
+_CREDS_RE = re.compile(r'https://[^@]*@')
+
 
 def clean_git_url(url: str) -> str:
     """Remove any credentials from git URL"""
-    return re.sub(r'https://[^@]*@', 'https://', url)
+    return _CREDS_RE.sub('https://', url)
 
 
 class DeployCommand(Command):
@@ -27,38 +28,35 @@ class DeployCommand(Command):
         Returns True if branches are identical, False if there are differences."""
         self.info(f"Checking if {branch1} matches {branch2}...")
         
-        # First ensure both branches exist
-        for branch in [branch1, branch2]:
-            result = self.run_subprocess(["git", "rev-parse", "--verify", branch], check=False)
-            if result is None:
-                self.error(f"Branch '{branch}' does not exist")
-                return False
-        
-        # Compare the branches using git diff
-        result = self.run_subprocess(["git", "diff", "--quiet", f"{branch1}..{branch2}"], check=False)
-        
-        # git diff returns:
-        # - 0 (success) if branches are identical
-        # - 1 if there are differences
-        # - other codes for errors
-        if result is None:
+        # Resolve both root trees in a single git call. Branches have identical
+        # content exactly when their trees have the same hash, so this avoids
+        # diffing the whole tree in the common case
+        result = self.run_subprocess(
+            ["git", "rev-parse", f"{branch1}^{{tree}}", f"{branch2}^{{tree}}"],
+            check=False
+        )
+        if result is None or result.returncode != 0:
+            # Only work out which branch is missing once we know something is
+            for branch in [branch1, branch2]:
+                verify = self.run_subprocess(["git", "rev-parse", "--verify", "--quiet", branch], check=False)
+                if verify is None or verify.returncode != 0:
+                    self.error(f"Branch '{branch}' does not exist")
+                    return False
             self.error(f"Failed to compare branches {branch1} and {branch2}")
             return False
-            
-        if result.returncode == 0:
+        trees = result.stdout.split()
+
+        if trees[0] == trees[1]:
             self.success(f"Branches {branch1} and {branch2} are identical")
             return True
-        elif result.returncode == 1:
-            self.warning(f"Found differences between {branch1} and {branch2}")
-            # Show a summary of differences
-            diff_stat = self.run_subprocess(["git", "diff", "--stat", f"{branch1}..{branch2}"], check=False)
-            if diff_stat and diff_stat.stdout:
-                self.info("\nChanges:")
-                self.info(diff_stat.stdout)
-            return False
-        else:
-            self.error(f"Error comparing branches: git diff returned {result.returncode}")
-            return False
+
+        self.warning(f"Found differences between {branch1} and {branch2}")
+        # Only walk the trees when we need to show a summary of differences
+        diff_stat = self.run_subprocess(["git", "diff", "--stat", f"{branch1}..{branch2}"], check=False)
+        if diff_stat and diff_stat.stdout:
+            self.info("\nChanges:")
+            self.info(diff_stat.stdout)
+        return False
 
     def get_git_branch(self) -> str:
         """Returns current git branch."""
@@ -91,26 +89,26 @@ class DeployCommand(Command):
 
 
     def handle(self, args):
-        # First check if we're in a Legend project
-        if not self.is_legend_project():
-            return
-
+        # Validates the environment and loads its configuration
         if not self.validate_environment(args.environment):
             return
 
-        # Load configuration
-        if not self.load_config(args.environment):
-            return
-
         status = True
 
         # Safeguards:
         # 1. check if there are uncommitted changes in git
-        status &= self.check_git_status()
-
         # 2. check if the current git branch matches config.azure.branch
-        git_branch = self.get_git_branch()
-        status &= git_branch == self.config.azure.branch
+        # These are independent git queries, so run them at the same time
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            git_status_future = executor.submit(self.check_git_status)
+            git_branch_future = executor.submit(self.get_git_branch)
+            status &= git_status_future.result()
+            git_branch = git_branch_future.result()
+
+        git_branch_ok = git_branch == self.config.azure.branch
+        if not git_branch_ok:
+            self.warning(f"Current branch '{git_branch}' does not match the configured branch '{self.config.azure.branch}'")
+        status &= git_branch_ok
 
         # 3. if env is production, also check that current branch has no changes to uat branch
         if args.environment == "production":
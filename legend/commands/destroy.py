@@ -1,3 +1,6 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from .base import Command
 
 class DestroyCommand(Command):
@@ -6,54 +9,117 @@ class DestroyCommand(Command):
     def __init__(self):
         super().__init__(
             name='destroy',
-            description='Delete all Azure resources for an environment',
-            aliases=[]
+            description='Delete all Azure resources for an environment'
         )
 
     def add_arguments(self, parser):
-        parser.add_argument('environment', 
-                          help='Environment to delete (e.g., sit, uat, production)')
+        parser.add_argument('environments',
+                          nargs='+',
+                          metavar='environment',
+                          help='Environment(s) to delete (e.g., sit, uat, production)')
+        parser.add_argument('--yes', '-y',
+                          action='store_true',
+                          help='Skip the confirmation prompts (requires --force)')
+        parser.add_argument('--force',
+                          action='append',
+                          metavar='FUNCTION_APP',
+                          help='Name of a function app being deleted, confirming it without a prompt (repeat for each environment)')
+        parser.add_argument('--dry-run',
+                          action='store_true',
+                          help='Only show what would be deleted, without prompting or calling Azure')
 
-    def handle(self, args):
-        if not self.validate_environment(args.environment):
-            return
+    def show_destroy_summary(self, environment: str, config):
+        """Show what deleting an environment will remove."""
+        self.warning(f"This will delete ALL resources in environment: {environment}")
+        print(f"Resource Group: {config.azure.resource_group}")
+        print(f"Function App: {config.azure.function_app}")
 
-        # Load configuration
-        config = self.load_config(args.environment)
-        if not config:
-            return
-
-        self.warning(f"This will delete ALL resources in environment: {args.environment}")
-        print(f"Resource Group: {self.config.azure.resource_group}")
-        print(f"Function App: {self.config.azure.function_app}")
+    def confirm_destroy(self, config, args) -> bool:
+        """Ask for (or check) confirmation to delete an environment.
+        Returns True if the deletion was confirmed."""
         print("\nThis action cannot be undone!")
 
+        if args.yes and args.force:
+            # Both confirmations given up front, e.g. from a CI pipeline
+            if config.azure.function_app in args.force:
+                return True
+            self.error(f"--force does not include {config.azure.function_app}. Aborted.")
+            return False
+        elif args.yes or args.force:
+            self.error("--yes and --force must be used together, with --force set to the function app name. Aborted.")
+            return False
+        elif not sys.stdin.isatty():
+            # input() would block or fail without a terminal to answer it
+            self.error("Cannot ask for confirmation without a terminal. Use --yes --force FUNCTION_APP. Aborted.")
+            return False
+
         # First confirmation
         confirm = input("\nAre you sure you want to proceed? (y/N): ")
         if confirm.lower() != 'y':
             print("Aborted.")
-            return
+            return False
 
         # Second confirmation - must type app name
-        print(f"\n\033[91mTo confirm, please type the function app name ({self.config.azure.function_app}):\033[0m")
+        print(f"\n\033[91mTo confirm, please type the function app name ({config.azure.function_app}):\033[0m")
         app_name = input("> ")
-        if app_name != self.config.azure.function_app:
+        if app_name != config.azure.function_app:
             self.error("App name does not match. Aborted.")
-            return
+            return False
 
-        # Delete resource group
-        print(f"\nDeleting resource group {self.config.azure.resource_group}...")
+        return True
+
+    def delete_resource_group(self, resource_group: str) -> bool:
+        """Start deleting a resource group without waiting for it to finish.
+        Returns True if the deletion was started."""
+        print(f"\nDeleting resource group {resource_group}...")
         try:
             self.run_azure_command([
                 "az",
                 "group", "delete",
-                "--name", self.config.azure.resource_group,
+                "--name", resource_group,
                 "--yes",  # Auto-confirm the Azure CLI prompt
                 "--no-wait"  # Don't wait for completion
             ])
-            self.success("Resource group deletion started")
-            print("\nNote: Deletion may take several minutes to complete")
-            print("Check the Azure portal for status")
+            self.success(f"Resource group {resource_group} deletion started")
+            return True
+        except subprocess.CalledProcessError as e:
+            # Rather than looking the group up first, let the delete itself
+            # tell us when there is nothing to delete
+            if "ResourceGroupNotFound" in (e.stderr or ""):
+                self.warning(f"Resource group {resource_group} not found, nothing to delete")
+                return False
+            self.error(f"Failed to delete resource group {resource_group}: {str(e)}")
+            return False
         except Exception as e:
-            self.error(f"Failed to delete resource group: {str(e)}")
+            self.error(f"Failed to delete resource group {resource_group}: {str(e)}")
+            return False
+
+    def handle(self, args):
+        # Validates each environment and loads its configuration
+        configs = []
+        for environment in dict.fromkeys(args.environments):
+            if not self.validate_environment(environment):
+                return
+            configs.append((environment, self.config))
+
+        # Confirm every environment before deleting anything
+        for environment, config in configs:
+            self.show_destroy_summary(environment, config)
+            if args.dry_run:
+                continue
+            if not self.confirm_destroy(config, args):
+                return 1
+
+        if args.dry_run:
+            self.info("\nDry run, nothing was deleted")
             return
+
+        # Deleting with --no-wait only starts the deletion, so the requests
+        # for several environments can all go out at once
+        resource_groups = [config.azure.resource_group for _, config in configs]
+        with ThreadPoolExecutor(max_workers=len(resource_groups)) as executor:
+            started = list(executor.map(self.delete_resource_group, resource_groups))
+
+        if any(started):
+            print("\nNote: Deletion may take several minutes to complete")
+            print("Check the Azure portal for status")
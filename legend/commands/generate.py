@@ -1,8 +1,20 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .base import Command
 
+# Fields GitHub's azure/login action needs from `az ad sp create-for-rbac --sdk-auth`
+_SP_CREDENTIAL_KEYS = {"clientId", "clientSecret", "subscriptionId", "tenantId"}
+
+
+def _in_background(fn, *args):
+    """Start fn(*args) on a background thread and return its Future."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(fn, *args)
+    executor.shutdown(wait=False)
+    return future
+
 
 class GenerateCommand(Command):
     """Command to generate new Azure Functions and other components"""
@@ -10,8 +22,7 @@ class GenerateCommand(Command):
     def __init__(self):
         super().__init__(
             name='generate',
-            description='Generate a new Azure Function or other components',
-            aliases=['g']
+            description='Generate a new Azure Function or other components'
         )
 
     def add_arguments(self, parser):
@@ -67,6 +78,12 @@ class GenerateCommand(Command):
         """
         self.info(f"Generating function: {name} (template: {template}, auth level: {authlevel.upper()})")
 
+        # Load the test template while func new runs, so the render below
+        # doesn't have to wait for Jinja to start up and compile it
+        test_template = None
+        if not skip_test:
+            test_template = _in_background(self.load_template, "test/function.py")
+
         # Run func new
         try:
             cmd = [
@@ -86,7 +103,13 @@ class GenerateCommand(Command):
         if not skip_test:
             # Generate test file
             try:
-                self.info("Generating test file: test/functions/{name}_test.py")
+                # Wait for the preload; if it failed, the render reports why
+                test_template.exception()
+                # The directory almost always exists already, so check
+                # before trying to create it
+                if not os.path.isdir("test/functions"):
+                    os.makedirs("test/functions")
+                self.info(f"Generating test file: test/functions/{name}_test.py")
                 self.render_template(
                     "test/function.py",
                     f"test/functions/{name}_test.py",
@@ -99,8 +122,8 @@ class GenerateCommand(Command):
         return True
 
     def is_gh_logged_in(self):
-        result = self.run_subprocess(["gh", "auth", "status"])
-        return result.returncode == 0  # 0 means success, non-zero means failure
+        result = self.run_subprocess(["gh", "auth", "status"], check=False)
+        return result is not None and result.returncode == 0  # 0 means success, non-zero means failure
 
 
     def generate_github_workflow(self, env):
@@ -114,6 +137,10 @@ class GenerateCommand(Command):
             }
         )
 
+        # The GitHub login check doesn't depend on Azure, so run it while the
+        # az calls below are in flight
+        gh_logged_in = _in_background(self.is_gh_logged_in)
+
         # get fully qualified id for the resource group
         resource_group_id = self.run_azure_command(
             [
@@ -121,13 +148,14 @@ class GenerateCommand(Command):
                 "group",
                 "show",
                 "--name", self.config.azure.resource_group,
-                "--query", "id",
-                "-o", "tsv"
+                "--query", "id"
             ]
         )
 
         # create azure service principal
-        principal = self.run_subprocess(
+        # (through run_azure_command, like the lookup above, so it shares the
+        # in-process CLI session or at least its no-telemetry settings)
+        credentials = self.run_azure_command(
             [
                 "az",
                 "ad",
@@ -136,13 +164,17 @@ class GenerateCommand(Command):
                 "--name", f"{self.config.azure.function_app}-sp",
                 "--role", "Contributor",
                 "--scopes", resource_group_id,
-                "--sdk-auth",
-                "-o", "json"
+                "--sdk-auth"
             ]
-        ).stdout.replace("\n"," ")
+        )
+        # Don't store anything in the GitHub secret that azure/login can't use
+        if not isinstance(credentials, dict) or not _SP_CREDENTIAL_KEYS <= credentials.keys():
+            self.error("Unexpected output from 'az ad sp create-for-rbac', GitHub secret not set")
+            return False
+        principal = json.dumps(credentials)
         print(principal)
 
-        if not self.is_gh_logged_in():
+        if not gh_logged_in.result():
             # log in to github
             self.run_subprocess(
                 [
@@ -165,7 +197,8 @@ class GenerateCommand(Command):
             text=True,
             check=True
         )
-        
+        return True
+
 
     def handle(self, args):
         if args.type in ['function', 'f']:
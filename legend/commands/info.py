@@ -1,5 +1,15 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from .base import Command
+from ..lib.names import short_resource_name
+
+# Resource Manager batch endpoint, and how many requests it is sent at a time
+ARM_BATCH_URL = "https://management.azure.com/batch?api-version=2020-06-01"
+ARM_BATCH_SIZE = 20
+
+# App Service API version used for the function key requests in a batch
+WEB_API_VERSION = "2022-03-01"
 
 class InfoCommand(Command):
     """Command to show information about the deployed function app"""
@@ -7,13 +17,16 @@ class InfoCommand(Command):
     def __init__(self):
         super().__init__(
             name='info',
-            description='Show information about the deployed function app',
-            aliases=['i']
+            description='Show information about the deployed function app'
         )
 
     def add_arguments(self, parser):
         parser.add_argument('environment', 
                           help='Environment to show info for (e.g., development, test, sit)')
+        parser.add_argument('--max-connections',
+                          type=int,
+                          default=8,
+                          help='Maximum number of Azure requests to run at once (default: 8)')
 
 
 
@@ -43,6 +56,44 @@ class InfoCommand(Command):
         ], check=False)
         return result
 
+    def get_all_function_keys(self, app_id: str, function_names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Get function keys for several functions with a single batch request.
+
+        Args:
+            app_id: Resource ID of the function app
+            function_names: Names of the functions to get keys for
+
+        Returns:
+            Dict of function name to its keys. Functions whose keys could not
+            be fetched are left out.
+        """
+        requests = [
+            {
+                "httpMethod": "POST",
+                "name": str(i),
+                "url": f"{app_id}/functions/{name}/listkeys?api-version={WEB_API_VERSION}"
+            }
+            for i, name in enumerate(function_names)
+        ]
+        result = self.run_azure_command([
+            "az",
+            "rest",
+            "--method", "post",
+            "--uri", ARM_BATCH_URL,
+            "--body", json.dumps({"requests": requests})
+        ], check=False)
+
+        keys = {}
+        for response in (result or {}).get("responses", []):
+            if response.get("httpStatusCode") != 200:
+                continue
+            content = response.get("content") or {}
+            # listkeys wraps the keys in 'properties', while the az command
+            # used by get_function_keys returns them directly
+            content = content.get("properties", content)
+            keys[function_names[int(response["name"])]] = content
+        return keys
+
     def get_host_keys(self, resource_group: str, app_name: str) -> Dict[str, str]:
         """Get host keys including master key"""
         result = self.run_azure_command(
@@ -56,16 +107,14 @@ class InfoCommand(Command):
         )
         return result
 
-    def get_hostname(self, resource_group: str, app_name: str) -> str:
-        """Get the function app's hostname"""
+    def get_function_app(self, resource_group: str, app_name: str) -> Dict[str, Any]:
+        """Get the function app's details, including its hostname and resource ID"""
         result = self.run_azure_command(
             [
                 "az",
                 "functionapp", "show",
                 "--resource-group", resource_group,
-                "--name", app_name,
-                "--query", "defaultHostName",
-                "-o", "tsv"
+                "--name", app_name
             ],
             check=False
         )
@@ -73,23 +122,61 @@ class InfoCommand(Command):
 
 
     def handle(self, args):
+        # Validates the environment and loads its configuration
         if not self.validate_environment(args.environment):
             return
 
-        if not self.load_config(args.environment):
-            return    
+        resource_group = self.config.azure.resource_group
+        app_name = self.config.azure.function_app
+
+        # These lookups don't depend on each other, so send them all at once
+        # and keep at most --max-connections requests in flight
+        with ThreadPoolExecutor(max_workers=max(1, args.max_connections)) as executor:
+            app_future = executor.submit(self.get_function_app, resource_group, app_name)
+            host_keys_future = executor.submit(self.get_host_keys, resource_group, app_name)
+            functions_future = executor.submit(self.get_functions, resource_group, app_name)
+
+            # Get host name for URLs - do this early to verify app is accessible
+            app = app_future.result()
+            hostname = app.get('defaultHostName') if isinstance(app, dict) else None
+            if not hostname:
+                self.error(f"Failed to get hostname for function app {app_name}. Does the app exist?")
+                self.info(f"To create it, run: legend provision {args.environment}")
+                return
+
+            # Get list of functions, and start fetching every function's keys,
+            # batching the requests rather than running az once per function
+            # Skip entries without a usable function name, e.g. 'app/'
+            named = [
+                (func, short_resource_name(func.get('name') or ''))
+                for func in functions_future.result() or []
+            ]
+            named = [(func, name) for func, name in named if name]
+            functions = [func for func, _ in named]
+            names = [name for _, name in named]
+            batch_futures = [
+                executor.submit(self.get_all_function_keys, app['id'], names[i:i + ARM_BATCH_SIZE])
+                for i in range(0, len(names), ARM_BATCH_SIZE)
+            ]
+
+            self.info(f"\nFunction App: {app_name}")
+            self.info(f"Resource Group: {resource_group}")
+            
+            # Get host keys (including master key)
+            host_keys = host_keys_future.result()
 
-        # Get host name for URLs - do this early to verify app is accessible
-        hostname = self.get_hostname(self.config.azure.resource_group, self.config.azure.function_app)
-        if not hostname:
-            self.error(f"Failed to get hostname for function app {self.config.azure.function_app}. Does the app exist?")
-            return
+            keys_by_function = {}
+            for batch_future in batch_futures:
+                keys_by_function.update(batch_future.result())
+
+            # Fall back to one az call per function for anything the batch
+            # requests couldn't answer
+            missing = [name for name in names if name not in keys_by_function]
+            missing_keys = executor.map(
+                lambda name: self.get_function_keys(resource_group, app_name, name), missing
+            )
+            keys_by_function.update(zip(missing, missing_keys))
 
-        self.info(f"\nFunction App: {self.config.azure.function_app}")
-        self.info(f"Resource Group: {self.config.azure.resource_group}")
-        
-        # Get host keys (including master key)
-        host_keys = self.get_host_keys(self.config.azure.resource_group, self.config.azure.function_app)
         if host_keys:
             self.info("\nHost Keys:")
             # Master key is returned directly as a string
@@ -107,44 +194,36 @@ class InfoCommand(Command):
                 
         self.info("\nFunctions:")
 
-        # Get list of functions
-        functions = self.get_functions(self.config.azure.resource_group, self.config.azure.function_app)
         if not functions:
             self.info("No functions found. Deploy your code first using 'legend deploy'")
             return
 
-        # For each function, show details and keys
-        for func in functions:
-            # Get function name from the full name (app/function)
-            full_name = func.get('name', '')
-            name = full_name.split('/')[-1] if '/' in full_name else full_name
-            if not name:
-                continue
-                
-            self.info(f"\n{name}:")
-            self.info(f"  Invoke URL: {func.get('invokeUrlTemplate', 'unknown')}")
+        # App-level keys are the same for every function
+        app_master_key = host_keys.get('masterKey') if host_keys else None
+        app_default_key = (host_keys or {}).get('functionKeys', {}).get('default')
+
+        # For each function, show details and keys, in the order Azure listed them
+        for func, name in zip(functions, names):
+            url = func.get('invokeUrlTemplate', 'unknown')
+            lines = [f"\n{name}:", f"  Invoke URL: {url}"]
             
             # Get function keys
-            keys = self.get_function_keys(self.config.azure.resource_group, 
-                                        self.config.azure.function_app, 
-                                        name)
+            keys = keys_by_function.get(name) or {}
             # Filter out None values
             valid_keys = {k: v for k, v in keys.items() if v is not None}
 
-            self.info("  URLs with keys:")
+            lines.append("  URLs with keys:")
             # Add app-level master key if available
-            if host_keys and host_keys.get('masterKey') is not None:
-                self.info(f"  🔑 App Master Key:")
-                self.info(f"    {func.get('invokeUrlTemplate')}?code={host_keys['masterKey']}")
+            if app_master_key is not None:
+                lines += ["  🔑 App Master Key:", f"    {url}?code={app_master_key}"]
                 
             # Add app-level default key if available
-            app_default_key = host_keys.get('functionKeys', {}).get('default')
             if app_default_key is not None:
-                self.info(f"  🔑 App Default Key:")
-                self.info(f"    {func.get('invokeUrlTemplate')}?code={app_default_key}")
+                lines += ["  🔑 App Default Key:", f"    {url}?code={app_default_key}"]
                 
             # Add function-specific keys
-            if valid_keys:
-                for key_name, key_value in valid_keys.items():
-                    self.info(f"  🔑 Function {key_name}:")
-                    self.info(f"    {func.get('invokeUrlTemplate')}?code={key_value}")
+            for key_name, key_value in valid_keys.items():
+                lines += [f"  🔑 Function {key_name}:", f"    {url}?code={key_value}"]
+
+            # One write per function rather than one per line
+            self.info("\n".join(lines))
@@ -1,30 +1,93 @@
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from ..lib import names
-from .base import Command
+from .base import Command, TEMPLATES_DIR
+
+# Templates copied into every new project's lib/ directory
+_LIB_TEMPLATES = str(TEMPLATES_DIR / "lib")
+
+# The new project's virtual environment interpreter, relative to the project
+_VENV_PYTHON = ".venv/bin/python" if os.name != "nt" else ".venv\\Scripts\\python.exe"
+
+# A template containing none of these has nothing for Jinja to render
+_JINJA_TAGS = (b"{{", b"{%", b"{#")
+
+
+def _walk_files(root: str):
+    """Yield a DirEntry for every file under root.
+
+    Uses os.scandir, whose entries already know their type, instead of
+    stat()ing every path. Bytecode caches are skipped.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _ensure_dirs(directories):
+    """Create directories and their parents, each with a single mkdir.
+
+    Shared parents (and directories listed twice) are only created once.
+    """
+    seen = set()
+    for directory in directories:
+        directory = Path(directory)
+        for path in reversed((directory, *directory.parents)):
+            if path in seen or path == Path("."):
+                continue
+            path.mkdir(exist_ok=True)
+            seen.add(path)
 
 
 class NewCommand(Command):
     """Command to create a new Azure Function App project"""
 
+    # Environments a new project is configured for; local ones are never
+    # deployed, so they get a simpler config and no deployment templates
+    _ENVS = ("development", "test", "sit", "uat", "production")
+    _LOCAL_ENVS = frozenset({"development", "test"})
+
+    # Additional dependencies to add to requirements.txt
+    _ADDITIONAL_DEPS = (
+        "jinja2>=3.1.2",
+    )
+
+    # Development dependencies
+    _DEV_DEPS = (
+        "git+https://github.com/maxvolumedev/legend_cli.git",  # dev/test only; we don't need to deploy the legend cli
+        "tomli>=2.0.1  # For reading TOML configuration files",
+        "pytest>=7.4.0",
+        "pytest-cov>=4.0.0"
+    )
+
+    # Commands to suggest once the project has been created
+    _NEXT_STEPS = "\n".join([
+        "  legend generate function             # Generate a new function",
+        "  legend test                          # Run tests",
+        "  legend run                           # Run function app locally",
+        "  legend console                       # Start interactive console",
+        "  legend provision <env>               # Provision Azure resources for env",
+        "  legend deploy <env>                  # Deploy env to Azure",
+        "  legend info <env>                    # Show app info for env, including deployed function URLs",
+    ])
+
+    # The dependency lists never change, so build the file contents up front
+    _REQUIREMENTS_BLOCK = "\n\n# Additional dependencies added by Legend CLI\n" + "\n".join(_ADDITIONAL_DEPS) + "\n"
+    _REQUIREMENTS_DEV = "-r requirements.txt\n\n# Development dependencies\n" + "\n".join(_DEV_DEPS) + "\n"
+
     def __init__(self):
         super().__init__(
             name='new',
-            description='Create a new Azure Function App',
-            aliases=['n']
+            description='Create a new Azure Function App'
         )
-        # Additional dependencies to add to requirements.txt
-        self.additional_deps = [
-            "jinja2>=3.1.2",
-        ]
-
-        # Development dependencies
-        self.dev_deps = [
-            "git+https://github.com/maxvolumedev/legend_cli.git",  # dev/test only; we don't need to deploy the legend cli
-            "tomli>=2.0.1  # For reading TOML configuration files",
-            "pytest>=7.4.0",
-            "pytest-cov>=4.0.0"
-        ]
 
     def add_arguments(self, parser):
         parser.add_argument('name', help='Name of the function app')
@@ -34,14 +97,17 @@ class NewCommand(Command):
             nargs='?', 
             default='australiasoutheast'
         )
+        parser.add_argument(
+            '--skip-install',
+            action='store_true',
+            help="Don't install dependencies into the virtual environment"
+        )
 
     def check_requirements(self):
         """Check if required tools are installed."""
-        # Check if Azure Functions Core Tools is installed
-        try:
-            self.run_subprocess(["func", "--version"], capture_output=True)
-            return True
-        except Exception:
+        # Check if Azure Functions Core Tools is installed; a PATH lookup is
+        # enough, without starting the (Node.js) func CLI itself
+        if shutil.which("func") is None:
             self.error("Azure Functions Core Tools (func CLI) is not installed.")
             self.info("\nTo install:")
             self.info("\n legend bootstrap")
@@ -49,6 +115,7 @@ class NewCommand(Command):
             self.info("  brew install azure-functions-core-tools@4")
             self.info("\nOr visit: https://learn.microsoft.com/en-us/azure/azure-functions/functions-run-local")
             return False
+        return True
 
     def create_project_structure(self, app_name: str):
         """Create the initial project structure and files."""
@@ -61,45 +128,38 @@ class NewCommand(Command):
         os.chdir(app_name)
 
         # Create project directories
-        for directory in [".github/workflows", "test", "test/functions","lib", "config", "bin", "deployment"]:
-            os.makedirs(directory, exist_ok=True)
+        _ensure_dirs([".github/workflows", "test/functions", "lib", "config", "bin", "deployment"])
 
     def create_dependency_files(self):
         """Create requirements.txt and requirements-dev.txt"""
         # Append additional dependencies to requirements.txt
         with open("requirements.txt", "a") as f:
-            f.write("\n\n# Additional dependencies added by Legend CLI\n")
-            for dep in self.additional_deps:
-                f.write(f"{dep}\n")
+            f.write(self._REQUIREMENTS_BLOCK)
 
         # Create requirements-dev.txt
         with open("requirements-dev.txt", "w") as f:
-            f.write("-r requirements.txt\n\n")
-            f.write("# Development dependencies\n")
-            for dep in self.dev_deps:
-                f.write(f"{dep}\n")
+            f.write(self._REQUIREMENTS_DEV)
 
     def create_config_files(self, app_name: str, location: str):
         """Create configuration files for all environments."""
         normalized_name = names.normalize_name(app_name)
         
         # Create global application config
-        self.render_template(
+        templates = [(
             "config/application.toml",
             "config/application.toml",
             {
                 "app_name": normalized_name,
                 "azure_location": location
             }
-        )
+        )]
 
         # Create environment configuration files
-        environments = ["development", "test", "sit", "uat", "production"]
-        for environment in environments:
+        for environment in self._ENVS:
             config_file = f"config/{environment}.toml"            
-            template_name = "config/environment-local.toml" if environment in ["development", "test"] else "config/environment.toml"
+            template_name = "config/environment-local.toml" if environment in self._LOCAL_ENVS else "config/environment.toml"
             
-            self.render_template(
+            templates.append((
                 template_name,
                 config_file,
                 {
@@ -107,13 +167,13 @@ class NewCommand(Command):
                     "function_app": f"{normalized_name}-{environment}",
                     "resource_group": f"{normalized_name}-group-{environment}",
                 }
-            )
+            ))
 
-            if environment in ["development", "test"]:
+            if environment in self._LOCAL_ENVS:
                 continue
 
-            self.render_template("deployment/azuredeploy.json", f"deployment/azuredeploy-{environment}.json", {} )
-            self.render_template("deployment/azuredeploy.parameters.json", f"deployment/azuredeploy-{environment}.parameters.json",
+            templates.append(("deployment/azuredeploy.json", f"deployment/azuredeploy-{environment}.json", {}))
+            templates.append(("deployment/azuredeploy.parameters.json", f"deployment/azuredeploy-{environment}.parameters.json",
                 {
                     "app_name": normalized_name,
                     "environment": environment,
@@ -124,41 +184,59 @@ class NewCommand(Command):
                     "key_vault_name": names.get_keyvault_name(normalized_name, environment),
                     "location": location,
                 }
-            )          
+            ))
+
+        self.render_templates(templates)
 
     def copy_lib_templates(self, app_name: str):
         """Copy library templates to the project."""
-        templates_dir = Path(__file__).parent.parent / "templates"
-        lib_templates = templates_dir / "lib"
-        if not lib_templates.exists():
+        if not os.path.isdir(_LIB_TEMPLATES):
             return
             
-        for template_path in lib_templates.rglob("*"):
-            if not template_path.is_file():
-                continue
-                
-            relative_path = template_path.relative_to(lib_templates)
-            target_path = Path("lib") / relative_path
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            if template_path.suffix == ".py":
-                self.render_template(
-                    str(Path("lib") / relative_path),
+        # Entry paths all start with the templates root, so the relative
+        # path is just the rest of the string
+        files = [
+            (entry, Path("lib", entry.path[len(_LIB_TEMPLATES) + 1:]))
+            for entry in _walk_files(_LIB_TEMPLATES)
+        ]
+        _ensure_dirs(target_path.parent for _, target_path in files)
+
+        templates = []
+        for entry, target_path in files:
+            if entry.name.endswith(".py"):
+                source = Path(entry.path).read_bytes()
+                if not any(tag in source for tag in _JINJA_TAGS):
+                    # Nothing to render, so skip Jinja and copy it as is
+                    if self.confirm_overwrite(str(target_path)):
+                        target_path.write_bytes(source)
+                    continue
+                templates.append((
+                    target_path.as_posix(),
                     str(target_path),
                     {"app_name": app_name}
-                )
+                ))
             else:
-                import shutil
-                shutil.copy2(template_path, target_path)
+                # A fresh file needs no metadata copied over, just the contents
+                shutil.copyfile(entry.path, target_path)
 
-    def init_virtual_env(self):
-        """Create and initialize virtual environment."""
-        self.info("Creating virtual environment...")
-        self.run_subprocess(["python", "-m", "venv", ".venv"])
-        
-        # Install dependencies
-        venv_python = ".venv/bin/python" if os.name != "nt" else ".venv\\Scripts\\python.exe"
-        self.run_subprocess([venv_python, "-m", "pip", "install", "-r", "requirements-dev.txt"])
+        self.render_templates(templates)
+
+    def create_virtual_env(self):
+        """Create the virtual environment."""
+        import venv
+        # Build it in-process rather than starting another interpreter to run
+        # `python -m venv`; pip is still bootstrapped by ensurepip
+        venv.EnvBuilder(with_pip=True, symlinks=os.name != "nt").create(".venv")
+
+    def install_dependencies(self):
+        """Install the project's dependencies into the virtual environment."""
+        if shutil.which("uv"):
+            # uv resolves and installs much faster than pip, so use it when it's there
+            cmd = ["uv", "pip", "install", "--python", _VENV_PYTHON, "-r", "requirements-dev.txt"]
+        else:
+            cmd = [_VENV_PYTHON, "-m", "pip", "install", "--prefer-binary", "--disable-pip-version-check",
+                   "--no-input", "-r", "requirements-dev.txt"]
+        self.run_subprocess(cmd)
 
     def needs_legend_project(self) -> bool:
         return False
@@ -167,41 +245,54 @@ class NewCommand(Command):
         if not self.check_requirements():
             return 1
 
-        # try:
         # Create project structure
         self.create_project_structure(args.name)
 
-        # Create dependency files
-        self.create_dependency_files()
+        # Creating the virtual environment only needs the project directory
+        # `func init` just created, so do it in the background while the
+        # project files are written. Announced here rather than from the
+        # worker, so it can't land in the middle of an overwrite prompt.
+        self.info("Creating virtual environment...")
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            venv_future = executor.submit(self.create_virtual_env)
 
-        # Create project files from templates
-        for template in ["setup.py", "README.md", "bin/legend"]:
-            self.render_template(template, template, {"app_name": args.name})
-        
-        # Make the binstub executable
-        Path("bin/legend").chmod(0o755)
+            # Create dependency files
+            self.create_dependency_files()
 
-        # Create configuration files
-        self.create_config_files(args.name, args.location)
+            # Create project files from templates
+            self.render_templates([
+                (template, template, {"app_name": args.name})
+                for template in ["setup.py", "README.md", "bin/legend"]
+            ])
+            
+            # Make the binstub executable
+            Path("bin/legend").chmod(0o755)
 
-        # Copy library templates
-        self.copy_lib_templates(args.name)
+            # Create configuration files
+            self.create_config_files(args.name, args.location)
 
-        # Initialize virtual environment
-        self.init_virtual_env()
+            # Copy library templates
+            self.copy_lib_templates(args.name)
 
-        # Initialize Git
-        self.run_subprocess(["git", "init"])
+            # Install dependencies once the virtual environment is ready, and
+            # initialize Git alongside that
+            venv_future.result()
+            futures = [executor.submit(self.run_subprocess, ["git", "init"])]
+            if not args.skip_install:
+                futures.append(executor.submit(self.install_dependencies))
+            for future in futures:
+                future.result()
+        finally:
+            # If a step failed, don't start anything still queued; this waits
+            # for a venv build already under way, so it isn't left half-written
+            executor.shutdown(cancel_futures=True)
 
         self.completed("Created new Legend app!")
-        self.info(f"\nNext steps:")
-        self.info(f"  cd {args.name}")
-        self.info(f"  legend generate function             # Generate a new function")
-        self.info(f"  legend test                          # Run tests")
-        self.info(f"  legend run                           # Run function app locally")
-        self.info(f"  legend console                       # Start interactive console")
-        self.info(f"  legend provision <env>               # Provision Azure resources for env")
-        self.info(f"  legend deploy <env>                  # Deploy env to Azure")
-        self.info(f"  legend info <env>                    # Show app info for env, including deployed function URLs")
+        next_steps = ["\nNext steps:", f"  cd {args.name}"]
+        if args.skip_install:
+            next_steps.append(f"  {_VENV_PYTHON} -m pip install -r requirements-dev.txt  # Install dependencies")
+        next_steps.append(self._NEXT_STEPS)
+        self.info("\n".join(next_steps))
         
         return 0
\ No newline at end of file
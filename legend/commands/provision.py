@@ -6,8 +6,7 @@ class ProvisionCommand(Command):
     def __init__(self):
         super().__init__(
             name='provision',
-            description='Provision Azure resources for the application',
-            aliases=['p']
+            description='Provision Azure resources for the application'
         )
 
     def add_arguments(self, parser):
@@ -9,8 +9,7 @@ class RunCommand(Command):
     def __init__(self):
         super().__init__(
             name='run',
-            description='Run the Function App locally',
-            aliases=['r']
+            description='Run the Function App locally'
         )
 
     def add_arguments(self, parser):
@@ -10,8 +10,7 @@ class TestCommand(Command):
     def __init__(self):
         super().__init__(
             name='test',
-            description='Run tests with pytest',
-            aliases=['t']
+            description='Run tests with pytest'
         )
 
     def add_arguments(self, parser):
@@ -3,14 +3,38 @@
 import sys
 import os
 import argparse
-from importlib import metadata
-from legend.commands import new, deploy, bootstrap, info, destroy, console, test, run, generate, provision
+from legend import commands as legend_commands
+from legend.commands import COMMANDS, ALIASES
 
-try:
-    __version__ = metadata.version("legend-cli")
-except metadata.PackageNotFoundError:
-    # Package is not installed, fall back to _version.py
-    from legend._version import __version__
+
+def load_command(name: str):
+    """Import a command's module and instantiate the command."""
+    module_name, class_name, _ = COMMANDS[name]
+    return getattr(getattr(legend_commands, module_name), class_name)()
+
+def get_version() -> str:
+    """Return the installed legend-cli version."""
+    # importlib.metadata is slow to import, so only load it for --version
+    from importlib import metadata
+    try:
+        return metadata.version("legend-cli")
+    except metadata.PackageNotFoundError:
+        # Package is not installed, fall back to _version.py
+        from legend._version import __version__
+        return __version__
+
+
+class VersionAction(argparse.Action):
+    """Like argparse's 'version' action, but looks the version up on use."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default,
+                         nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        sys.stdout.write(get_version() + "\n")
+        parser.exit()
 
 def main():
     # Change to the directory where the legend command was invoked
@@ -24,34 +48,20 @@ def main():
     parser.add_argument('--verbose', '-v',
                        action='store_true',
                        help='Enable verbose output')
-    parser.add_argument("--version", action="version", version=__version__)
+    parser.add_argument("--version", action=VersionAction)
     
 
     subparsers = parser.add_subparsers(dest='command', required=False)
 
-    # Get all command instances
-    commands = [
-        new.NewCommand(),
-        generate.GenerateCommand(),
-        run.RunCommand(),
-        test.TestCommand(),
-        console.ConsoleCommand(),
-        provision.ProvisionCommand(),
-        deploy.DeployCommand(),
-        bootstrap.BootstrapCommand(),
-        info.InfoCommand(),
-        destroy.DestroyCommand(),
-    ]
-    
-    # Map commands by their names and aliases
-    COMMANDS = {}
-    for cmd in commands:
-        COMMANDS[cmd.name] = cmd
-        for alias in cmd.aliases:
-            COMMANDS[alias] = cmd
+    # Only set up the command being run; help and unknown commands need them all.
+    # Global options don't take values, so the first positional is the command.
+    requested = next((arg for arg in sys.argv[1:] if not arg.startswith('-')), None)
+    requested = ALIASES.get(requested, requested)
+    names = [requested] if requested in COMMANDS else list(COMMANDS)
+    commands = [load_command(name) for name in names]
 
     # Add each command's parser as a subparser
-    for cmd in set(COMMANDS.values()):
+    for cmd in commands:
         subparsers.add_parser(
             cmd.name,
             help=cmd.description,
@@ -68,8 +78,13 @@ def main():
     # Parse args to get command and global flags
     args = parser.parse_args()
 
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
     # Get the command
-    cmd = COMMANDS[args.command]
+    name = ALIASES.get(args.command, args.command)
+    cmd = next(cmd for cmd in commands if cmd.name == name)
     
     # Run command with parsed args and global verbose flag
     cmd.run(args)
@@ -1,8 +1,8 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 from types import SimpleNamespace
-import tomli
 
 
 class ConfigurationError(Exception):
@@ -10,6 +10,25 @@ class ConfigurationError(Exception):
     pass
 
 
+@lru_cache(maxsize=32)
+def _parse_toml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a TOML file, cached per path and modification time.
+
+    Callers must treat the returned dict as read-only, as it is shared.
+    """
+    # Imported here so commands that never load config don't pay for it
+    import tomli
+
+    with open(path, "rb") as f:
+        return tomli.load(f)
+
+
+def _read_toml(path: Path) -> Dict[str, Any]:
+    """Read a TOML file, reparsing it only when it has changed on disk"""
+    path = path.resolve()
+    return _parse_toml(str(path), os.stat(path).st_mtime_ns)
+
+
 class Configuration:
     """Manages environment-specific configuration with dot notation access"""
     
@@ -48,8 +67,7 @@ class Configuration:
             # Load global config
             global_config = {}
             if self.global_config_path.exists():
-                with open(self.global_config_path, "rb") as f:
-                    global_config = tomli.load(f)
+                global_config = _read_toml(self.global_config_path)
             
             # Load environment config
             if not self.env_config_path.exists():
@@ -58,8 +76,7 @@ class Configuration:
                     f"Create {self.env_config_path.name} in the config directory"
                 )
                 
-            with open(self.env_config_path, "rb") as f:
-                env_config = tomli.load(f)
+            env_config = _read_toml(self.env_config_path)
             
             # Merge configurations (environment config takes precedence)
             merged = self._deep_merge(global_config, env_config)
@@ -71,7 +88,9 @@ class Configuration:
                 f"Configuration file not found: {config_file}\n" +
                 f"Create {config_file} in the config directory"
             )
-        except tomli.TOMLDecodeError as e:
+        except ValueError as e:
+            # tomli.TOMLDecodeError, caught by its base class as tomli is
+            # only imported once a file is actually parsed
             raise ConfigurationError(
                 f"Invalid TOML syntax in configuration:\n{e}\n" +
                 f"Check syntax in {self.global_config_path.name} and {self.env_config_path.name}"
@@ -1,11 +1,23 @@
 import re
 import uuid
+from functools import lru_cache
 
+# Characters not allowed in storage account and key vault names
+_STORAGE_NAME_INVALID = re.compile(r'[^a-z0-9]')
+_KEYVAULT_NAME_INVALID = re.compile(r'[^a-z0-9-]')
+_HYPHENS = re.compile(r'-+')
 
+
+@lru_cache(maxsize=128)
 def normalize_name(name: str) -> str:
     """Normalize app name: lowercase and replace underscores with hyphens"""
     return name.lower().replace('_', '-')
 
+def short_resource_name(full_name: str) -> str:
+    """Last segment of an Azure resource name, e.g. 'myapp/myfunction' -> 'myfunction'"""
+    return full_name.rpartition('/')[2]
+
+@lru_cache(maxsize=128)
 def generate_short_name(name: str, max_len: int = 24) -> str:
     """Generate a meaningful short name from a longer name.
     
@@ -165,7 +177,7 @@ def get_storage_name(app_name: str, env: str) -> str:
     short_name = generate_short_name(app_name, max_len=20)  # Leave room for env
     name = f"{short_name}{env}"
     # Remove any non-alphanumeric characters and convert to lowercase
-    name = re.sub(r'[^a-z0-9]', '', name.lower())
+    name = _STORAGE_NAME_INVALID.sub('', name.lower())
     # Ensure minimum length of 3
     if len(name) < 3:
         name = name + 'x' * (3 - len(name))
@@ -181,9 +193,9 @@ def get_keyvault_name(app_name: str, env: str) -> str:
     short_name = generate_short_name(app_name, max_len=19)  # Leave room for env and 'kv'
     name = f"{short_name}{env}kv"
     # Remove any characters not allowed in key vault names
-    name = re.sub(r'[^a-z0-9-]', '', name.lower())
+    name = _KEYVAULT_NAME_INVALID.sub('', name.lower())
     # Remove consecutive hyphens
-    name = re.sub(r'-+', '-', name)
+    name = _HYPHENS.sub('-', name)
     # Remove leading/trailing hyphens
     name = name.strip('-')
     # Ensure minimum length of 3
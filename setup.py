@@ -21,6 +21,11 @@ setup(
         "azure-functions",
         "tomli>=2.0.1",  # For reading TOML configuration files
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.9",  # Faster parsing of Azure CLI JSON output
+        ],
+    },
     entry_points={
         "console_scripts": [
             "legend=legend.__main__:main",